@@ -963,6 +963,26 @@ public class PqRowApiTest {
         }
     }
 
+    @Test
+    void testDictionaryRleEncoding() throws Exception {
+        Path parquetFile = Paths.get("src/test/resources/dict_rle.parquet");
+        String[] names = { "alice", "bob", "charlie" };
+
+        try (ParquetFileReader fileReader = ParquetFileReader.open(parquetFile);
+             RowReader rowReader = fileReader.createRowReader()) {
+
+            // All columns are dictionary encoded in v2 data pages; tag is a single RLE run
+            for (int i = 0; i < 30; i++) {
+                rowReader.next();
+                assertThat(rowReader.getLong("id")).isEqualTo(i + 1L);
+                assertThat(rowReader.getString("name")).isEqualTo(names[i % 3]);
+                assertThat(rowReader.getString("tag")).isEqualTo("x");
+            }
+
+            assertThat(rowReader.hasNext()).isFalse();
+        }
+    }
+
     @Test
     void testIteratorReuse() throws Exception {
         Path parquetFile = Paths.get("src/test/resources/plain_uncompressed.parquet");
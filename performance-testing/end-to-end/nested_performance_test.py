@@ -24,100 +24,158 @@ Usage:
 """
 
 import argparse
+import gc
 import os
 import platform
+import sys
 import time
 from pathlib import Path
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.acero as ac
 import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
 DATA_FILE = Path("../test-data-setup/target/overture-maps-data/overture_places.zstd.parquet")
 DEFAULT_RUNS = 5
+MAX_IO_THREADS = 16
+RESULT_ROW_FORMAT = "  {name:<30s} {duration_s:>12.2f} {rps:>15,.0f} {rps_core:>18,.0f} {mbps:>12.1f}"
 
 CONTENDERS = {
     "single_threaded": ("PyArrow (single-threaded)", False),
     "multi_threaded": ("PyArrow (multi-threaded)", True),
 }
 
+# Columns read from the file; struct children are selected individually so unused
+# siblings (bbox.ymin/ymax, other names fields) are never read or decoded
+COLUMNS = [
+    "version",
+    "confidence",
+    "bbox.xmin",
+    "bbox.xmax",
+    "websites",
+    "sources",
+    "addresses",
+    "names.primary",
+    "names.common",
+]
+
+# Leaf columns with min/max aggregates, by projected name; these can alternatively be
+# answered from the column chunk statistics (see --use-statistics)
+RANGE_COLUMNS = {
+    "version": "version",  # int
+    "confidence": "confidence",  # double
+    "bbox_xmin": "bbox.xmin",  # struct field
+    "bbox_xmax": "bbox.xmax",
+}
+
+RANGE_PROJECTION = {name: pc.field(*path.split(".")) for name, path in RANGE_COLUMNS.items()}
+
+RANGE_AGGREGATES = [
+    ("version", "min", None, "min_version"),
+    ("version", "max", None, "max_version"),
+    ("confidence", "min", None, "min_confidence"),
+    ("confidence", "max", None, "max_confidence"),
+    ("bbox_xmin", "min", None, "min_bbox_xmin"),
+    ("bbox_xmax", "max", None, "max_bbox_xmax"),
+]
+
+# names.primary (string): max length
+NAME_PROJECTION = {"primary_name_length": pc.utf8_length(pc.field("names", "primary"))}
+
+NAME_AGGREGATES = [("primary_name_length", "max", None, "max_primary_name_length")]
 
-def _map_value_length(map_column):
-    """Compute per-row entry count for a map column.
 
-    pc.list_value_length doesn't support map types, so we compute sizes
-    from the underlying offsets (end - start) for each chunk.
+def _value_counts(column):
+    """Compute the total entry count and max entries per row for a list or map column.
+
+    Both are derived from each chunk's offsets: the total is the distance between the
+    first and last offset, the per-row sizes are the differences between neighbours.
+    Null rows have empty offset ranges in arrays read from Parquet, so they contribute
+    to neither. This also covers maps, which pc.list_value_length doesn't support.
+    """
+    total = 0
+    max_per_row = 0
+    for chunk in column.chunks:
+        if len(chunk) == 0:
+            continue
+        offsets = chunk.offsets.to_numpy()
+        total += int(offsets[-1] - offsets[0])
+        max_per_row = max(max_per_row, int(np.diff(offsets).max()))
+    return total, max_per_row
+
+
+def _ranges_from_statistics(metadata):
+    """Answer the min/max aggregates from the column chunk statistics in the footer.
+
+    Returns None if any row group lacks min/max statistics for one of the columns,
+    in which case the values have to be decoded.
     """
-    chunks = []
-    for chunk in map_column.chunks:
-        n = len(chunk)
-        starts = chunk.offsets.slice(0, n)
-        ends = chunk.offsets.slice(1)
-        sizes = pc.subtract(ends, starts)
-        if chunk.null_count > 0:
-            sizes = pc.if_else(chunk.is_valid(), sizes, None)
-        chunks.append(sizes)
-    return pa.chunked_array(chunks)
-
-
-def compute_aggregates(file_path, use_threads):
-    """Read the parquet file and compute nested aggregates."""
-    table = pq.read_table(file_path, use_threads=use_threads)
+    column_indices = {metadata.schema.column(i).path: i for i in range(metadata.num_columns)}
+    ranges = {}
+    for column, function, _, name in RANGE_AGGREGATES:
+        index = column_indices[RANGE_COLUMNS[column]]
+        values = []
+        for row_group in range(metadata.num_row_groups):
+            statistics = metadata.row_group(row_group).column(index).statistics
+            if statistics is None or not statistics.has_min_max:
+                return None
+            values.append(getattr(statistics, function))
+        if not values:
+            return None
+        ranges[name] = min(values) if function == "min" else max(values)
+    return ranges
+
+
+def _aggregate(table, projection, aggregates, use_threads):
+    """Run a projection followed by an aggregation over the table as one Acero plan."""
+    plan = ac.Declaration.from_sequence([
+        ac.Declaration("table_source", ac.TableSourceNodeOptions(table)),
+        ac.Declaration("project", ac.ProjectNodeOptions(list(projection.values()), list(projection.keys()))),
+        ac.Declaration("aggregate", ac.AggregateNodeOptions(aggregates)),
+    ])
+    return plan.to_table(use_threads=use_threads).to_pylist()[0]
+
+
+def compute_aggregates(file_path, use_threads, use_statistics=False):
+    """Read the parquet file and compute nested aggregates.
+
+    All min/max aggregates are computed by one Acero plan (projection followed by
+    aggregation), so each column is visited once rather than once per compute kernel.
+    List and map sizes are taken directly from their offsets. With use_statistics, the
+    min/max aggregates are taken from the footer where possible and their columns are
+    not read at all.
+    """
+    parquet_file = pq.ParquetFile(file_path, memory_map=True, pre_buffer=True)
+    ranges = _ranges_from_statistics(parquet_file.metadata) if use_statistics else None
+
+    if ranges is None:
+        table = parquet_file.read(columns=COLUMNS, use_threads=use_threads)
+        aggregates = _aggregate(table, RANGE_PROJECTION | NAME_PROJECTION,
+                                RANGE_AGGREGATES + NAME_AGGREGATES, use_threads)
+    else:
+        columns = [c for c in COLUMNS if c not in RANGE_COLUMNS.values()]
+        table = parquet_file.read(columns=columns, use_threads=use_threads)
+        aggregates = ranges | _aggregate(table, NAME_PROJECTION, NAME_AGGREGATES, use_threads)
     row_count = table.num_rows
 
-    # version (int): min/max
-    version = table.column("version")
-    min_version = pc.min(version).as_py()
-    max_version = pc.max(version).as_py()
-
-    # confidence (double): min/max
-    confidence = table.column("confidence")
-    min_confidence = pc.min(confidence).as_py()
-    max_confidence = pc.max(confidence).as_py()
-
-    # bbox (struct): xmin min, xmax max
-    bbox = table.column("bbox")
-    bbox_xmin = pc.struct_field(bbox, "xmin")
-    bbox_xmax = pc.struct_field(bbox, "xmax")
-    min_bbox_xmin = pc.min(bbox_xmin).as_py()
-    max_bbox_xmax = pc.max(bbox_xmax).as_py()
-
-    # websites (list<string>): total count, max per row
-    websites = table.column("websites")
-    website_sizes = pc.list_value_length(websites)
-    total_website_count = pc.sum(website_sizes, skip_nulls=True).as_py() or 0
-    max_website_count = pc.max(website_sizes, skip_nulls=True).as_py() or 0
-
-    # sources (list<struct>): total count, max per row
-    sources = table.column("sources")
-    source_sizes = pc.list_value_length(sources)
-    total_source_count = pc.sum(source_sizes, skip_nulls=True).as_py() or 0
-    max_source_count = pc.max(source_sizes, skip_nulls=True).as_py() or 0
-
-    # addresses (list<struct>): total count, max per row
-    addresses = table.column("addresses")
-    address_sizes = pc.list_value_length(addresses)
-    total_address_count = pc.sum(address_sizes, skip_nulls=True).as_py() or 0
-    max_address_count = pc.max(address_sizes, skip_nulls=True).as_py() or 0
-
-    # names.common (map<string, string>): total entries, max per row
-    names = table.column("names")
-    names_common = pc.struct_field(names, "common")
-    common_sizes = _map_value_length(names_common)
-    total_name_entries = pc.sum(common_sizes, skip_nulls=True).as_py() or 0
-    max_name_entries = pc.max(common_sizes, skip_nulls=True).as_py() or 0
-
-    # names.primary (string): max length
-    names_primary = pc.struct_field(names, "primary")
-    primary_lengths = pc.utf8_length(names_primary)
-    max_primary_name_length = pc.max(primary_lengths, skip_nulls=True).as_py() or 0
+    # websites (list<string>), sources, addresses (list<struct>), names.common (map<string, string>):
+    # total entries, max per row
+    total_website_count, max_website_count = _value_counts(table.column("websites"))
+    total_source_count, max_source_count = _value_counts(table.column("sources"))
+    total_address_count, max_address_count = _value_counts(table.column("addresses"))
+    total_name_entries, max_name_entries = _value_counts(pc.struct_field(table.column("names"), "common"))
+
+    min_bbox_xmin = aggregates["min_bbox_xmin"]
+    max_bbox_xmax = aggregates["max_bbox_xmax"]
 
     return {
         "row_count": row_count,
-        "min_version": min_version,
-        "max_version": max_version,
-        "min_confidence": min_confidence,
-        "max_confidence": max_confidence,
+        "min_version": aggregates["min_version"],
+        "max_version": aggregates["max_version"],
+        "min_confidence": aggregates["min_confidence"],
+        "max_confidence": aggregates["max_confidence"],
         "min_bbox_xmin": float(min_bbox_xmin) if min_bbox_xmin is not None else None,
         "max_bbox_xmax": float(max_bbox_xmax) if max_bbox_xmax is not None else None,
         "total_website_count": total_website_count,
@@ -128,10 +186,21 @@ def compute_aggregates(file_path, use_threads):
         "max_address_count": max_address_count,
         "total_name_entries": total_name_entries,
         "max_name_entries": max_name_entries,
-        "max_primary_name_length": max_primary_name_length,
+        "max_primary_name_length": aggregates["max_primary_name_length"] or 0,
     }
 
 
+def configure_thread_pools():
+    """Size Arrow's CPU and I/O thread pools for this machine.
+
+    The I/O pool is oversubscribed relative to the cores, as its threads mostly wait on
+    reads issued by pre-buffering.
+    """
+    cpu_count = os.cpu_count() or 1
+    pa.set_cpu_count(cpu_count)
+    pa.set_io_thread_count(min(MAX_IO_THREADS, cpu_count * 2))
+
+
 def parse_contenders(value):
     """Parse contender specification from command line."""
     if value is None or value.strip().lower() == "all":
@@ -144,11 +213,10 @@ def parse_contenders(value):
     return names
 
 
-def print_result_row(name, row_count, duration_s, cpu_cores, total_bytes):
+def format_result_row(name, row_count, duration_s, cpu_cores, total_bytes):
     rps = row_count / duration_s
-    rps_core = rps / cpu_cores
-    mbps = (total_bytes / (1024 * 1024)) / duration_s
-    print(f"  {name:<30s} {duration_s:>12.2f} {rps:>15,.0f} {rps_core:>18,.0f} {mbps:>12.1f}")
+    return RESULT_ROW_FORMAT.format(name=name, duration_s=duration_s, rps=rps, rps_core=rps / cpu_cores,
+                                    mbps=(total_bytes / (1024 * 1024)) / duration_s)
 
 
 def print_results(file_size, run_count, enabled, results):
@@ -164,6 +232,7 @@ def print_results(file_size, run_count, enabled, results):
     print(f"  CPU cores:       {cpu_count}")
     print(f"  Python version:  {platform.python_version()}")
     print(f"  PyArrow version: {pa.__version__}")
+    print(f"  Arrow threads:   {pa.cpu_count()} CPU, {pa.io_thread_count()} I/O")
     print(f"  OS:              {platform.system()} {platform.machine()}")
     print()
     print("Data:")
@@ -210,13 +279,12 @@ def print_results(file_size, run_count, enabled, results):
         contender_results = results[contender_key]
         cores = cpu_count if use_threads else 1
 
-        for i, (_, duration) in enumerate(contender_results):
-            label = f"{display_name} [{i + 1}]"
-            print_result_row(label, row_count, duration, cores, file_size)
-
         durations = [d for _, d in contender_results]
         avg_duration = sum(durations) / len(durations)
-        print_result_row(f"{display_name} [AVG]", row_count, avg_duration, cores, file_size)
+        rows = [format_result_row(f"{display_name} [{i + 1}]", row_count, duration, cores, file_size)
+                for i, duration in enumerate(durations)]
+        rows.append(format_result_row(f"{display_name} [AVG]", row_count, avg_duration, cores, file_size))
+        sys.stdout.write("\n".join(rows) + "\n")
 
         min_d = min(durations)
         max_d = max(durations)
@@ -233,6 +301,9 @@ def main():
                              f"Valid: {', '.join(CONTENDERS.keys())}")
     parser.add_argument("-r", "--runs", type=int, default=DEFAULT_RUNS,
                         help=f"Number of timed runs per contender (default: {DEFAULT_RUNS})")
+    parser.add_argument("-s", "--use-statistics", action="store_true",
+                        help="Take min/max aggregates from column chunk statistics instead of "
+                             "decoding the values (not comparable to the Java test)")
     args = parser.parse_args()
 
     enabled = parse_contenders(args.contenders)
@@ -250,11 +321,17 @@ def main():
     print(f"File size: {file_size / (1024 * 1024):,.1f} MB")
     print(f"Runs per contender: {run_count}")
     print(f"Enabled contenders: {', '.join(CONTENDERS[c][0] for c in enabled)}")
+    if args.use_statistics:
+        print("Min/max aggregates: from column chunk statistics")
 
-    # Warmup
+    configure_thread_pools()
+
+    # Warmup, once per contender so Arrow's thread pools are started before any timed run
     print("\nWarmup run...")
-    _, use_threads = CONTENDERS[enabled[0]]
-    compute_aggregates(DATA_FILE, use_threads)
+    for contender_key in enabled:
+        _, use_threads = CONTENDERS[contender_key]
+        compute_aggregates(DATA_FILE, use_threads, args.use_statistics)
+    gc.collect()
 
     # Timed runs
     print("\nTimed runs:")
@@ -265,9 +342,9 @@ def main():
         for i in range(run_count):
             label = f"{display_name} [{i + 1}/{run_count}]"
             print(f"  Running {label}...")
-            start = time.time()
-            result = compute_aggregates(DATA_FILE, use_threads)
-            duration = time.time() - start
+            start = time.perf_counter_ns()
+            result = compute_aggregates(DATA_FILE, use_threads, args.use_statistics)
+            duration = (time.perf_counter_ns() - start) / 1e9
             contender_results.append((result, duration))
         results[contender_key] = contender_results
 
@@ -6,32 +6,263 @@
 #  Licensed under the Apache Software License version 2.0, available at http://www.apache.org/licenses/LICENSE-2.0
 #
 
+import argparse
+import contextlib
+import io
+import os
+import sys
+import numpy as np
 import pyarrow as pa
 import pyarrow.parquet as pq
 from datetime import datetime, date, time
+from concurrent.futures import ThreadPoolExecutor, wait
 from decimal import Decimal
 import uuid
 
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+# Fixture paths are relative to the repository root, i.e. the directory of this script,
+# regardless of the directory the script is run from
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+TEST_RESOURCES_DIR = 'core/src/test/resources'
+INTEGRATION_TEST_RESOURCES_DIR = 'integration-test/src/test/resources'
+
+parser = argparse.ArgumentParser(description="Generate the Parquet test fixtures")
+parser.add_argument('--rows', type=positive_int, default=3,
+                    help="Number of rows in the plain_* files (default: 3, which the tests expect); "
+                         "other values require --output-dir")
+parser.add_argument('--output-dir',
+                    help=f"Generate only the plain_* files, into this directory instead of "
+                         f"{TEST_RESOURCES_DIR}; use it with e.g. --rows 1000000 to generate "
+                         "benchmark-sized files without touching the committed fixtures")
+parser.add_argument('--data-page-size', type=positive_int,
+                    help="Target data page size in bytes for the plain_* files (default: "
+                         "max(4096, 16 * rows) for up to 1024 rows, else the 1 MiB Parquet default)")
+parser.add_argument('--write-batch-size', type=positive_int,
+                    help="Number of values the writer encodes per batch for the plain_* files "
+                         "(default: rows for up to 1024 rows, else 8192)")
+parser.add_argument('--check', action='store_true',
+                    help="Don't write anything; verify that the existing files have the schema, data, "
+                         "compression, encodings and data page versions that would be generated, "
+                         "exiting with status 1 otherwise")
+args = parser.parse_args()
+if args.rows != 3 and args.output_dir is None:
+    parser.error("--output-dir is required when --rows is not 3, so the test fixtures are not overwritten")
+ROWS = args.rows
+PLAIN_OUTPUT_DIR = os.path.abspath(args.output_dir) if args.output_dir is not None else TEST_RESOURCES_DIR
+
+# Writer tunables for the plain_* files that --rows scales (the other fixtures use the
+# pyarrow defaults); by default small files get a single batch and page, and large ones
+# batches that are a multiple of the RLE run length of 8
+if args.data_page_size is not None:
+    DATA_PAGE_SIZE = args.data_page_size
+else:
+    DATA_PAGE_SIZE = max(4096, ROWS * 16) if ROWS <= 1024 else 1024 * 1024
+if args.write_batch_size is not None:
+    WRITE_BATCH_SIZE = args.write_batch_size
+else:
+    WRITE_BATCH_SIZE = ROWS if ROWS <= 1024 else 8192
+
+# Create the output directories up front rather than relying on them existing
+if not args.check:
+    for output_dir in (TEST_RESOURCES_DIR, PLAIN_OUTPUT_DIR, INTEGRATION_TEST_RESOURCES_DIR):
+        os.makedirs(os.path.join(REPO_DIR, output_dir), exist_ok=True)
+
+# The per-file "Generated ..." summaries are buffered and only printed once every write
+# has finished; in check mode nothing is generated, so they are discarded
+generation_output = contextlib.ExitStack()
+summaries = generation_output.enter_context(contextlib.redirect_stdout(io.StringIO()))
+
+# The files are independent of each other, so they are written concurrently (Arrow
+# releases the GIL while encoding); finish_writes() awaits them all at the end.
+write_executor = ThreadPoolExecutor()
+pending_writes = []  # (path, future) pairs
+
+# Files at least this large are flushed and dropped from the page cache after writing,
+# so benchmark-sized fixtures don't evict hotter pages
+DROP_CACHE_MIN_BYTES = 64 * 1024 * 1024
+
+
+def _has_content(path, data, chunk_size=1024 * 1024):
+    """Whether the file at path already holds exactly data, compared chunk by chunk.
+
+    Files of DROP_CACHE_MIN_BYTES or more are never compared, as reading them back
+    would pull them into the page cache again.
+    """
+    if data.size >= DROP_CACHE_MIN_BYTES or not os.path.exists(path) or os.path.getsize(path) != data.size:
+        return False
+    expected = memoryview(data).cast('B')  # Arrow buffers export signed chars
+    with open(path, 'rb') as f:
+        for offset in range(0, data.size, chunk_size):
+            if f.read(chunk_size) != expected[offset:offset + chunk_size]:
+                return False
+    return True
+
+
+# Parquet PageType values of data pages, mapped to the matching data_page_version
+DATA_PAGE_VERSIONS = {0: '1.0', 3: '2.0'}
+
+
+def _data_page_version(f, column):
+    """Version of the column chunk's first data page, read from its page header.
+
+    The footer doesn't record it; the header is a Thrift compact struct whose first
+    field (header byte 0x15) is the zigzag-encoded i32 page type.
+    """
+    f.seek(column.data_page_offset)
+    field_header, page_type = f.read(2)
+    return DATA_PAGE_VERSIONS.get(page_type >> 1) if field_header == 0x15 else None
+
+
+def _check_layout(path, options):
+    """Compare compression, encodings and data page versions of the file with the writer options."""
+    expected_compression = (options.get('compression', 'snappy') or 'uncompressed').upper()
+    use_dictionary = options.get('use_dictionary', True)
+    column_encoding = options.get('column_encoding') or {}
+    expected_page_version = options.get('data_page_version', '1.0')
+
+    metadata = pq.ParquetFile(path).metadata
+    with open(path, 'rb') as f:
+        for row_group_index in range(metadata.num_row_groups):
+            row_group = metadata.row_group(row_group_index)
+            for column_index in range(row_group.num_columns):
+                column = row_group.column(column_index)
+                name = column.path_in_schema
+                # pyarrow never dictionary encodes BOOLEAN columns
+                dictionary = (column.physical_type != 'BOOLEAN' and name not in column_encoding
+                              and (use_dictionary is True or (bool(use_dictionary) and name in use_dictionary)))
+                if name in column_encoding:
+                    expected_encoding = column_encoding[name]
+                else:
+                    expected_encoding = 'RLE_DICTIONARY' if dictionary else 'PLAIN'
+
+                if column.compression != expected_compression:
+                    return f"column {name} is {column.compression}, expected {expected_compression}"
+                if column.has_dictionary_page != dictionary or expected_encoding not in column.encodings:
+                    return (f"column {name} has encodings {column.encodings} "
+                            f"{'with' if column.has_dictionary_page else 'without'} a dictionary page, "
+                            f"expected {expected_encoding} {'with' if dictionary else 'without'} one")
+                page_version = _data_page_version(f, column)
+                if page_version != expected_page_version:
+                    return f"column {name} has data page version {page_version}, expected {expected_page_version}"
+    return None
+
+
+def _check_table(table, path, **options):
+    if not os.path.exists(path):
+        return "missing"
+    try:
+        existing = pq.read_table(path)
+        if not existing.equals(table):
+            return "schema or data differs from the generated table"
+        return _check_layout(path, options)
+    except pa.ArrowException as e:
+        return f"unreadable ({e})"
+
+
+def _write_table(table, path, **options):
+    # Encode in memory and write the finished file at once instead of one small
+    # write per page header, column chunk and footer part
+    sink = pa.BufferOutputStream()
+    with pq.ParquetWriter(sink, table.schema, **options) as writer:
+        writer.write_table(table)
+    data = sink.getvalue()
+    # Leave files whose content is unchanged untouched, so re-running the script
+    # neither rewrites them nor bumps their modification time
+    if _has_content(path, data):
+        return
+    with open(path, 'wb') as f:
+        f.write(data)
+        if data.size >= DROP_CACHE_MIN_BYTES and hasattr(os, 'posix_fadvise'):
+            f.flush()
+            os.fdatasync(f.fileno())
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def write_parquet(table, path, **options):
+    """Schedule the table to be written to path with the given ParquetWriter options.
+
+    Relative paths are resolved against REPO_DIR. With --check the existing file is
+    verified against the table instead.
+    """
+    full_path = os.path.join(REPO_DIR, path)
+    if args.check:
+        pending_writes.append((path, write_executor.submit(_check_table, table, full_path, **options)))
+    else:
+        pending_writes.append((path, write_executor.submit(_write_table, table, full_path, **options)))
+
+
+def finish_writes():
+    """Wait for every scheduled write (or check), then print the summaries or report all failures.
+
+    Exits with status 1 if any write or check failed.
+    """
+    try:
+        wait([future for _, future in pending_writes])
+    finally:
+        write_executor.shutdown(cancel_futures=True)
+        generation_output.close()
+
+    failures = []
+    for path, future in pending_writes:
+        if future.exception() is not None:
+            failures.append(f"{path}: {future.exception()!r}")
+        elif future.result() is not None:
+            failures.append(f"{path}: {future.result()}")
+    if failures:
+        for failure in failures:
+            print(f"{'CHECK FAILED' if args.check else 'FAILED'} {failure}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.check:
+        print(f"\nChecked {len(pending_writes)} files: all up to date")
+    else:
+        sys.stdout.write(summaries.getvalue())
+
+
 # Plain encoding with no compression (for Milestone 1)
 # Create a simple table with NO nulls first, explicitly marking fields as non-nullable
 schema = pa.schema([
     ('id', pa.int64(), False),  # False = not nullable (REQUIRED)
     ('value', pa.int64(), False)
 ])
-simple_table = pa.table({
-    'id': [1, 2, 3],
-    'value': [100, 200, 300]
-}, schema=schema)
-
-pq.write_table(simple_table, 'core/src/test/resources/plain_uncompressed.parquet',
-               use_dictionary=False,
-               compression=None,
-               data_page_version='1.0')
-
-print("Generated plain_uncompressed.parquet:")
-print("  - Encoding: PLAIN (use_dictionary=False)")
-print("  - Compression: UNCOMPRESSED (compression=None)")
-print("  - Data: id=[1,2,3], value=[100,200,300] - NO NULLS")
+ids = np.arange(1, ROWS + 1, dtype=np.int64)
+simple_batch = pa.RecordBatch.from_arrays([
+    pa.array(ids, type=pa.int64()),
+    pa.array(ids * 100, type=pa.int64())
+], schema=schema)
+simple_table = pa.Table.from_batches([simple_batch], schema=schema)
+
+# Write the same table uncompressed and SNAPPY compressed
+MIN_COMPRESSIBLE_PAGE_BYTES = 512
+simple_table_cases = [
+    ('plain_uncompressed.parquet', None, "UNCOMPRESSED (compression=None)"),
+    ('plain_snappy.parquet', 'snappy', "SNAPPY (compression='snappy')"),
+]
+# The plain_* summaries are collected and written to stdout in one go
+plain_summaries = []
+for file_name, compression, compression_description in simple_table_cases:
+    write_parquet(simple_table, os.path.join(PLAIN_OUTPUT_DIR, file_name),
+                  use_dictionary=False,
+                  compression=compression,
+                  data_page_version='1.0',
+                  data_page_size=DATA_PAGE_SIZE,
+                  write_batch_size=WRITE_BATCH_SIZE)
+
+    summary = (f"Generated {file_name}:\n"
+               "  - Encoding: PLAIN (use_dictionary=False)\n"
+               f"  - Compression: {compression_description}\n"
+               f"  - Data: {ROWS} rows, id=[1..{ROWS}], value=id*100 - NO NULLS\n")
+    # Snappy only pays off above a few hundred bytes; the file is still needed by the tests
+    if compression and ROWS * 8 < MIN_COMPRESSIBLE_PAGE_BYTES:
+        summary += f"  - Note: {ROWS * 8} byte pages are too small to compress, expect SNAPPY to grow them\n"
+    plain_summaries.append(summary)
 
 # Also generate one with nulls
 # Make id REQUIRED (no nulls) and name OPTIONAL (with nulls)
@@ -39,30 +270,32 @@ schema_with_nulls = pa.schema([
     ('id', pa.int64(), False),  # REQUIRED - no nulls
     ('name', pa.string(), True)  # OPTIONAL - can have nulls
 ])
-table_with_nulls = pa.table({
-    'id': [1, 2, 3],
-    'name': ['alice', None, 'charlie']
-}, schema=schema_with_nulls)
-pq.write_table(table_with_nulls, 'core/src/test/resources/plain_uncompressed_with_nulls.parquet',
-               use_dictionary=False,
-               compression=None,
-               data_page_version='1.0')
-
-print("\nGenerated plain_uncompressed_with_nulls.parquet:")
-print("  - Encoding: PLAIN (use_dictionary=False)")
-print("  - Compression: UNCOMPRESSED (compression=None)")
-print("  - Data: id=[1,2,3], name=['alice', None, 'charlie']")
-
-# Generate SNAPPY compressed file with same data as plain_uncompressed
-pq.write_table(simple_table, 'core/src/test/resources/plain_snappy.parquet',
-               use_dictionary=False,
-               compression='snappy',
-               data_page_version='1.0')
-
-print("\nGenerated plain_snappy.parquet:")
-print("  - Encoding: PLAIN (use_dictionary=False)")
-print("  - Compression: SNAPPY (compression='snappy')")
-print("  - Data: id=[1,2,3], value=[100,200,300] - NO NULLS")
+# Names cycle through alice/bob/charlie, with the middle name of each cycle null
+names = np.tile(np.array(['alice', 'bob', 'charlie'], dtype=object), ROWS // 3 + 1)[:ROWS]
+name_mask = np.zeros(ROWS, dtype=bool)
+name_mask[1::3] = True
+batch_with_nulls = pa.RecordBatch.from_arrays([
+    pa.array(ids, type=pa.int64()),
+    pa.array(names, mask=name_mask, type=pa.string())
+], schema=schema_with_nulls)
+table_with_nulls = pa.Table.from_batches([batch_with_nulls], schema=schema_with_nulls)
+write_parquet(table_with_nulls, os.path.join(PLAIN_OUTPUT_DIR, 'plain_uncompressed_with_nulls.parquet'),
+              use_dictionary=False,
+              compression=None,
+              data_page_version='1.0',
+              data_page_size=DATA_PAGE_SIZE,
+              write_batch_size=WRITE_BATCH_SIZE)
+
+plain_summaries.append("Generated plain_uncompressed_with_nulls.parquet:\n"
+                       "  - Encoding: PLAIN (use_dictionary=False)\n"
+                       "  - Compression: UNCOMPRESSED (compression=None)\n"
+                       f"  - Data: {ROWS} rows, id=[1..{ROWS}], name=['alice', None, 'charlie', ...]\n")
+sys.stdout.write("\n".join(plain_summaries))
+
+# With --output-dir only the plain_* files are generated; the other fixtures are left alone
+if args.output_dir is not None:
+    finish_writes()
+    sys.exit()
 
 # Generate dictionary encoded file with strings
 schema_dict = pa.schema([
@@ -75,16 +308,43 @@ table_dict = pa.table({
 }, schema=schema_dict)
 
 # Only use dictionary for the category column (column 1), not id (column 0)
-pq.write_table(table_dict, 'core/src/test/resources/dictionary_uncompressed.parquet',
-               use_dictionary=['category'],  # Only dictionary encode the category column
-               compression=None,
-               data_page_version='1.0')
+write_parquet(table_dict, 'core/src/test/resources/dictionary_uncompressed.parquet',
+              use_dictionary=['category'],  # Only dictionary encode the category column
+              compression=None,
+              data_page_version='1.0')
 
 print("\nGenerated dictionary_uncompressed.parquet:")
 print("  - Encoding: DICTIONARY (use_dictionary=True)")
 print("  - Compression: UNCOMPRESSED")
 print("  - Data: id=[1,2,3,4,5], category=['A','B','A','C','B']")
 
+# Generate dictionary + RLE encoded file: the name indices cycle (bit-packed runs)
+# while the constant tag column is one long RLE run
+dict_rle_rows = 30  # fixed, enough rows for RLE runs longer than 8
+schema_dict_rle = pa.schema([
+    ('id', pa.int64(), False),
+    ('name', pa.dictionary(pa.int32(), pa.string()), False),
+    ('tag', pa.string(), False)
+])
+dict_rle_ids = np.arange(1, dict_rle_rows + 1, dtype=np.int64)
+table_dict_rle = pa.Table.from_arrays([
+    pa.array(dict_rle_ids),
+    pa.DictionaryArray.from_arrays(
+        pa.array(np.arange(dict_rle_rows, dtype=np.int32) % 3),
+        pa.array(['alice', 'bob', 'charlie'])
+    ),
+    pa.array(np.full(dict_rle_rows, 'x', dtype=object), type=pa.string())
+], schema=schema_dict_rle)
+write_parquet(table_dict_rle, 'core/src/test/resources/dict_rle.parquet',
+              use_dictionary=True,
+              compression=None,
+              data_page_version='2.0')
+
+print("\nGenerated dict_rle.parquet:")
+print("  - Encoding: DICTIONARY (use_dictionary=True), data page v2")
+print("  - Compression: UNCOMPRESSED")
+print("  - Data: 30 rows, id=[1..30], name=['alice','bob','charlie',...], tag='x'")
+
 # Generate logical types test file
 logical_types_schema = pa.schema([
     ('id', pa.int32(), False),  # Simple INT32 (no logical type)
@@ -108,72 +368,78 @@ logical_types_schema = pa.schema([
     ('account_id', pa.uuid(), False),  # UUID logical type (supported in PyArrow 21+)
 ])
 
+# Columns are built as typed arrays so no per-value type inference is needed
 logical_types_data = {
-    'id': [1, 2, 3],
-    'name': ['Alice', 'Bob', 'Charlie'],
-    'birth_date': [
+    'id': pa.array(np.array([1, 2, 3], dtype=np.int32)),
+    'name': pa.array(['Alice', 'Bob', 'Charlie'], type=pa.string()),
+    'birth_date': pa.array([
         date(1990, 1, 15),
         date(1985, 6, 30),
         date(2000, 12, 25)
-    ],
-    'created_at_millis': [
+    ], type=pa.date32()),
+    'created_at_millis': pa.array([
         datetime(2025, 1, 1, 10, 30, 0),
         datetime(2025, 1, 2, 14, 45, 30),
         datetime(2025, 1, 3, 9, 15, 45)
-    ],
-    'created_at_micros': [
+    ], type=pa.timestamp('ms', tz='UTC')),
+    'created_at_micros': pa.array([
         datetime(2025, 1, 1, 10, 30, 0, 123456),
         datetime(2025, 1, 2, 14, 45, 30, 654321),
         datetime(2025, 1, 3, 9, 15, 45, 111222)
-    ],
+    ], type=pa.timestamp('us', tz='UTC')),
     # NANOS columns use raw int64 values since Python datetime only supports microseconds
     # Values are nanoseconds since epoch with 9-digit precision (e.g., .123456789)
-    'created_at_nanos': pa.array([
+    'created_at_nanos': pa.array(np.array([
         1735727400123456789,  # 2025-01-01T10:30:00.123456789Z
         1735829130654321987,  # 2025-01-02T14:45:30.654321987Z
         1735895745111222333,  # 2025-01-03T09:15:45.111222333Z
-    ], type=pa.timestamp('ns', tz='UTC')),
-    'wake_time_millis': [
+    ], dtype=np.int64), type=pa.timestamp('ns', tz='UTC')),
+    'wake_time_millis': pa.array([
         time(7, 30, 0),
         time(8, 0, 0),
         time(6, 45, 0)
-    ],
-    'wake_time_micros': [
+    ], type=pa.time32('ms')),
+    'wake_time_micros': pa.array([
         time(7, 30, 0, 123456),
         time(8, 0, 0, 654321),
         time(6, 45, 0, 111222)
-    ],
+    ], type=pa.time64('us')),
     # TIME NANOS uses raw int64 values (nanoseconds since midnight)
-    'wake_time_nanos': pa.array([
+    'wake_time_nanos': pa.array(np.array([
         27000123456789,  # 7:30:00.123456789
         28800654321987,  # 8:00:00.654321987
         24300111222333,  # 6:45:00.111222333
-    ], type=pa.time64('ns')),
-    'balance': [
+    ], dtype=np.int64), type=pa.time64('ns')),
+    'balance': pa.array([
         Decimal('1234.56'),
         Decimal('9876.54'),
         Decimal('5555.55')
-    ],
-    'tiny_int': [10, 20, 30],
-    'small_int': [1000, 2000, 3000],
-    'medium_int': [100000, 200000, 300000],
-    'big_int': [10000000000, 20000000000, 30000000000],
-    'tiny_uint': [255, 128, 64],
-    'small_uint': [65535, 32768, 16384],
+    ], type=pa.decimal128(10, 2)),
+    'tiny_int': pa.array(np.array([10, 20, 30], dtype=np.int8)),
+    'small_int': pa.array(np.array([1000, 2000, 3000], dtype=np.int16)),
+    'medium_int': pa.array(np.array([100000, 200000, 300000], dtype=np.int32)),
+    'big_int': pa.array(np.array([10000000000, 20000000000, 30000000000], dtype=np.int64)),
+    'tiny_uint': pa.array(np.array([255, 128, 64], dtype=np.uint8)),
+    'small_uint': pa.array(np.array([65535, 32768, 16384], dtype=np.uint16)),
     # For UINT_32, use values that fit in signed int32 for easier testing
-    'medium_uint': [2147483647, 1000000, 500000],
+    'medium_uint': pa.array(np.array([2147483647, 1000000, 500000], dtype=np.uint32)),
     # Java's long is signed, so max is 2^63-1. Use values within signed long range for testing.
-    'big_uint': [9223372036854775807, 5000000000000000000, 4611686018427387904],
-    'account_id': [
+    'big_uint': pa.array(np.array([9223372036854775807, 5000000000000000000, 4611686018427387904],
+                                  dtype=np.uint64)),
+    'account_id': pa.array([
         uuid.UUID('12345678-1234-5678-1234-567812345678').bytes,
         uuid.UUID('87654321-4321-8765-4321-876543218765').bytes,
         uuid.UUID('aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee').bytes
-    ]
+    ], type=pa.uuid())
 }
 
-logical_types_table = pa.table(logical_types_data, schema=logical_types_schema)
+# The arrays already have the schema's types, so assemble them directly without inference
+logical_types_batch = pa.RecordBatch.from_arrays(
+    [logical_types_data[field.name] for field in logical_types_schema],
+    schema=logical_types_schema)
+logical_types_table = pa.Table.from_batches([logical_types_batch])
 
-pq.write_table(
+write_parquet(
     logical_types_table,
     'core/src/test/resources/logical_types_test.parquet',
     use_dictionary=False,
@@ -210,7 +476,7 @@ nested_struct_data = {
 }
 
 nested_struct_table = pa.table(nested_struct_data, schema=nested_struct_schema)
-pq.write_table(
+write_parquet(
     nested_struct_table,
     'core/src/test/resources/nested_struct_test.parquet',
     use_dictionary=False,
@@ -245,7 +511,7 @@ list_basic_data = {
 }
 
 list_basic_table = pa.table(list_basic_data, schema=list_basic_schema)
-pq.write_table(
+write_parquet(
     list_basic_table,
     'core/src/test/resources/list_basic_test.parquet',
     use_dictionary=False,
@@ -280,7 +546,7 @@ list_struct_data = {
 }
 
 list_struct_table = pa.table(list_struct_data, schema=list_struct_schema)
-pq.write_table(
+write_parquet(
     list_struct_table,
     'core/src/test/resources/list_struct_test.parquet',
     use_dictionary=False,
@@ -348,7 +614,7 @@ nested_list_struct_data = [
 ]
 
 nested_list_struct_table = pa.Table.from_pylist(nested_list_struct_data, schema=nested_list_struct_schema)
-pq.write_table(
+write_parquet(
     nested_list_struct_table,
     'core/src/test/resources/nested_list_struct_test.parquet',
     use_dictionary=False,
@@ -426,7 +692,7 @@ deep_nested_struct_data = [
 ]
 
 deep_nested_struct_table = pa.Table.from_pylist(deep_nested_struct_data, schema=deep_nested_struct_schema)
-pq.write_table(
+write_parquet(
     deep_nested_struct_table,
     'core/src/test/resources/deep_nested_struct_test.parquet',
     use_dictionary=False,
@@ -483,7 +749,7 @@ nested_list_data = [
 ]
 
 nested_list_table = pa.Table.from_pylist(nested_list_data, schema=nested_list_schema)
-pq.write_table(
+write_parquet(
     nested_list_table,
     'core/src/test/resources/nested_list_test.parquet',
     use_dictionary=False,
@@ -535,7 +801,7 @@ address_book_data = [
 ]
 
 address_book_table = pa.Table.from_pylist(address_book_data, schema=address_book_schema)
-pq.write_table(
+write_parquet(
     address_book_table,
     'core/src/test/resources/address_book_test.parquet',
     use_dictionary=False,
@@ -591,7 +857,7 @@ triple_nested_data = [
 ]
 
 triple_nested_table = pa.Table.from_pylist(triple_nested_data, schema=triple_nested_schema)
-pq.write_table(
+write_parquet(
     triple_nested_table,
     'core/src/test/resources/triple_nested_list_test.parquet',
     use_dictionary=False,
@@ -624,7 +890,7 @@ delta_int_data = {
 delta_int_table = pa.table(delta_int_data, schema=delta_int_schema)
 
 # Force DELTA_BINARY_PACKED encoding for all integer columns
-pq.write_table(
+write_parquet(
     delta_int_table,
     'core/src/test/resources/delta_binary_packed_test.parquet',
     use_dictionary=False,
@@ -650,7 +916,7 @@ delta_optional_data = {
 
 delta_optional_table = pa.table(delta_optional_data, schema=delta_optional_schema)
 
-pq.write_table(
+write_parquet(
     delta_optional_table,
     'core/src/test/resources/delta_binary_packed_optional_test.parquet',
     use_dictionary=False,
@@ -678,7 +944,7 @@ delta_string_data = {
 
 delta_string_table = pa.table(delta_string_data, schema=delta_string_schema)
 
-pq.write_table(
+write_parquet(
     delta_string_table,
     'core/src/test/resources/delta_length_byte_array_test.parquet',
     use_dictionary=False,
@@ -727,7 +993,7 @@ delta_byte_array_data = {
 
 delta_byte_array_table = pa.table(delta_byte_array_data, schema=delta_byte_array_schema)
 
-pq.write_table(
+write_parquet(
     delta_byte_array_table,
     'core/src/test/resources/delta_byte_array_test.parquet',
     use_dictionary=False,
@@ -780,7 +1046,7 @@ simple_map_data = [
 ]
 
 simple_map_table = pa.Table.from_pylist(simple_map_data, schema=simple_map_schema)
-pq.write_table(
+write_parquet(
     simple_map_table,
     'core/src/test/resources/simple_map_test.parquet',
     use_dictionary=False,
@@ -822,7 +1088,7 @@ map_types_data = [
 ]
 
 map_types_table = pa.Table.from_pylist(map_types_data, schema=map_types_schema)
-pq.write_table(
+write_parquet(
     map_types_table,
     'core/src/test/resources/map_types_test.parquet',
     use_dictionary=False,
@@ -877,7 +1143,7 @@ map_of_maps_data = [
 ]
 
 map_of_maps_table = pa.Table.from_pylist(map_of_maps_data, schema=map_of_maps_schema)
-pq.write_table(
+write_parquet(
     map_of_maps_table,
     'core/src/test/resources/map_of_maps_test.parquet',
     use_dictionary=False,
@@ -927,7 +1193,7 @@ list_of_maps_data = [
 ]
 
 list_of_maps_table = pa.Table.from_pylist(list_of_maps_data, schema=list_of_maps_schema)
-pq.write_table(
+write_parquet(
     list_of_maps_table,
     'core/src/test/resources/list_of_maps_test.parquet',
     use_dictionary=False,
@@ -971,7 +1237,7 @@ map_struct_value_data = [
 ]
 
 map_struct_value_table = pa.Table.from_pylist(map_struct_value_data, schema=map_struct_value_schema)
-pq.write_table(
+write_parquet(
     map_struct_value_table,
     'core/src/test/resources/map_struct_value_test.parquet',
     use_dictionary=False,
@@ -1009,7 +1275,7 @@ primitive_types_data = {
 }
 
 primitive_types_table = pa.table(primitive_types_data, schema=primitive_types_schema)
-pq.write_table(
+write_parquet(
     primitive_types_table,
     'core/src/test/resources/primitive_types_test.parquet',
     use_dictionary=False,
@@ -1057,7 +1323,7 @@ primitive_lists_data = [
 ]
 
 primitive_lists_table = pa.Table.from_pylist(primitive_lists_data, schema=primitive_lists_schema)
-pq.write_table(
+write_parquet(
     primitive_lists_table,
     'core/src/test/resources/primitive_lists_test.parquet',
     use_dictionary=False,
@@ -1087,7 +1353,7 @@ gzip_test_data = {
 }
 
 gzip_test_table = pa.table(gzip_test_data, schema=gzip_test_schema)
-pq.write_table(
+write_parquet(
     gzip_test_table,
     'integration-test/src/test/resources/gzip_compressed.parquet',
     use_dictionary=False,
@@ -1099,3 +1365,5 @@ print("\nGenerated gzip_compressed.parquet (in integration-test):")
 print("  - Encoding: PLAIN")
 print("  - Compression: GZIP")
 print("  - Data: 5 rows with id, name, value")
+
+finish_writes()